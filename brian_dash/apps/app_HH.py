@@ -9,7 +9,10 @@ from dash_table.Format import Format, Scheme
 import dash_bootstrap_components as dbc
 from dash.exceptions import PreventUpdate
 from dash.dependencies import Input, Output, State
-from brian_dash.models.HH import simulate_HH_neuron, filter_dataframe
+from brian_dash.models.HH import (
+    simulate_HH_neuron,
+    analysis_HH_neuron,
+    filter_dataframe)
 from brian_dash.input_factory import (
     get_step_current,
     get_ramp_current,
@@ -155,6 +158,13 @@ app.layout = dbc.Container(
             ),
             className="card",)], xs=11, sm=11, md=11, lg=11, xl=11,
         )]),
+        html.Br(),
+        dbc.Row([dbc.Col([html.Div(
+            children=dcc.Graph(
+                id="analysis-plots",
+            ),
+            className="card",)], xs=11, sm=11, md=11, lg=11, xl=11,
+        )]),
     ], fluid=True,
 )
 
@@ -251,5 +261,51 @@ def update_output(table_par, table_current, value):
     return fig
 
 
+@ app.callback(
+    Output('analysis-plots', 'figure'),
+    [Input("datatable-params", "derived_virtual_data")],
+    prevent_initial_call=False
+)
+def update_analysis(table_par):
+
+    if table_par is None:
+        raise PreventUpdate
+
+    df_par = pd.DataFrame(table_par)
+    data = analysis_HH_neuron(df_par)
+
+    fig = make_subplots(rows=2, cols=2,
+                        vertical_spacing=0.15, horizontal_spacing=0.08,
+                        subplot_titles=["steady state I-V",
+                                        "reduced (V, n) phase plane",
+                                        "gating steady state",
+                                        "gating time constant"])
+    for key, name in zip(["I_ss", "I_na", "I_k", "I_l"],
+                         ["I_ss", "I_Na", "I_K", "I_L"]):
+        fig.add_trace(go.Scatter(x=data['v'], y=data[key], mode='lines',
+                                 name=name), row=1, col=1)
+    fig.add_trace(go.Scatter(x=data['v_nullcline_v'], y=data['v_nullcline_n'],
+                             mode='markers', marker={"size": 2},
+                             name='dV/dt=0'), row=1, col=2)
+    fig.add_trace(go.Scatter(x=data['v'], y=data['n_nullcline_n'],
+                             mode='lines', name='dn/dt=0'), row=1, col=2)
+    for gate in ["m", "h", "n"]:
+        fig.add_trace(go.Scatter(x=data['v'], y=data[gate + '_inf'],
+                                 mode='lines', name=gate + '_inf'),
+                      row=2, col=1)
+        fig.add_trace(go.Scatter(x=data['v'], y=data['tau_' + gate],
+                                 mode='lines', name='tau_' + gate),
+                      row=2, col=2)
+    fig.update_yaxes(title_text="I (uA)", row=1, col=1)
+    fig.update_yaxes(title_text="n", range=[0, 1], row=1, col=2)
+    fig.update_yaxes(title_text="tau (ms)", row=2, col=2)
+    fig.update_xaxes(title_text="V (mV)", row=2, col=1)
+    fig.update_xaxes(title_text="V (mV)", row=2, col=2)
+    fig.update_layout(autosize=False,
+                      width=1500,
+                      height=800)
+    return fig
+
+
 if __name__ == "__main__":
     app.run_server(debug=False, port=8000)
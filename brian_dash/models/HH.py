@@ -2,6 +2,7 @@ import numpy as np
 import brian2 as b2
 import pandas as pd
 from time import time
+from functools import lru_cache
 # import pylab as plt
 from brian_dash.input_factory import *
 
@@ -60,6 +61,201 @@ def filter_dataframe(df, label):
         return None
 
 
+def _exprel(x):
+    """
+    vectorized x / (exp(x) - 1), with the removable singularity at x=0
+    replaced by its limit.
+    """
+    x = np.asarray(x, dtype=float)
+    small = np.abs(x) < 1e-6
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = x / np.expm1(x)
+    return np.where(small, 1.0 - 0.5 * x, y)
+
+
+# rate functions of the HH model, membrane potential in [mV], rates in [1/ms]
+# these are the same expressions used in the equations of simulate_HH_neuron
+
+def alpha_n(v):
+    return 0.1 * _exprel((-60.0 - np.asarray(v, dtype=float)) / 10.0)
+
+
+def beta_n(v):
+    return 0.125 * np.exp(-(np.asarray(v, dtype=float) + 70.0) / 80.0)
+
+
+def alpha_m(v):
+    return _exprel(-(np.asarray(v, dtype=float) + 45.0) / 10.0)
+
+
+def beta_m(v):
+    return 4.0 * np.exp(-(np.asarray(v, dtype=float) + 70.0) / 18.0)
+
+
+def alpha_h(v):
+    return 0.07 * np.exp(-(np.asarray(v, dtype=float) + 70.0) / 20.0)
+
+
+def beta_h(v):
+    return 1.0 / (np.exp(-(np.asarray(v, dtype=float) + 40.0) / 10.0) + 1.0)
+
+
+_RATES = {"m": (alpha_m, beta_m),
+          "h": (alpha_h, beta_h),
+          "n": (alpha_n, beta_n)}
+
+
+def gating_steady_state(v, gate):
+    """
+    steady state value x_inf(v) = alpha / (alpha + beta) of a gating variable
+
+    Parameters
+    -------------
+
+    v : array_like
+        membrane potential [mV]
+    gate : str
+        one of "m", "h", "n"
+
+    return : ndarray
+        steady state values, same shape as v
+
+    """
+    alpha, beta = _RATES[gate]
+    a = alpha(v)
+    return a / (a + beta(v))
+
+
+def gating_time_constant(v, gate):
+    """
+    time constant tau_x(v) = 1 / (alpha + beta) of a gating variable [ms]
+
+    Parameters
+    -------------
+
+    v : array_like
+        membrane potential [mV]
+    gate : str
+        one of "m", "h", "n"
+
+    return : ndarray
+        time constants, same shape as v
+
+    """
+    alpha, beta = _RATES[gate]
+    return 1.0 / (alpha(v) + beta(v))
+
+
+_ANALYSIS_PARAMETERS = ["El", "Ek", "Ena", "gl", "gk", "gna", "C", "v0"]
+
+
+def parameter_key(par):
+    """
+    hashable key of the parameters which affect the analysis views
+
+    Parameters
+    -------------
+
+    par : Dataframe
+        parameter table with "parameter" and "value" columns
+
+    return : tuple
+        tuple of float values in the order of _ANALYSIS_PARAMETERS
+
+    """
+    return tuple(float(filter_dataframe(par, label))
+                 for label in _ANALYSIS_PARAMETERS)
+
+
+def _readonly(**arrays):
+    # cached results are shared between calls, protect them from mutation
+    for value in arrays.values():
+        value.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=32)
+def _analysis_HH_neuron(key, v_min, v_max, num_v, num_n, I_ext):
+
+    El, Ek, Ena, gl, gk, gna, C, v0 = key
+    v = np.linspace(v_min, v_max, num_v)
+
+    m_inf = gating_steady_state(v, "m")
+    h_inf = gating_steady_state(v, "h")
+    n_inf = gating_steady_state(v, "n")
+
+    # current needed to clamp the membrane at v [uA]
+    I_na = gna * m_inf**3 * h_inf * (v - Ena)
+    I_k = gk * n_inf**4 * (v - Ek)
+    I_l = gl * (v - El)
+    I_ss = I_na + I_k + I_l
+
+    # reduced (V, n) system: m is instantaneous and h + n is kept at its
+    # value at the resting potential v0
+    h_plus_n = float(gating_steady_state(v0, "h") +
+                     gating_steady_state(v0, "n"))
+    n = np.linspace(0.0, 1.0, num_n)
+    vv = v[np.newaxis, :]
+    nn = n[:, np.newaxis]
+    hh = np.clip(h_plus_n - nn, 0.0, 1.0)
+    dvdt = (I_ext + gna * m_inf[np.newaxis, :]**3 * hh * (Ena - vv) +
+            gk * nn**4 * (Ek - vv) + gl * (El - vv)) / C
+
+    # V-nullcline: zero crossings of dV/dt along n, linearly interpolated
+    lo, hi = dvdt[:-1, :], dvdt[1:, :]
+    i_n, i_v = np.nonzero(np.signbit(lo) != np.signbit(hi))
+    frac = lo[i_n, i_v] / (lo[i_n, i_v] - hi[i_n, i_v])
+    v_nullcline_n = n[i_n] + frac * (n[i_n + 1] - n[i_n])
+    v_nullcline_v = v[i_v]
+    order = np.argsort(v_nullcline_v, kind="stable")
+
+    return _readonly(
+        v=v,
+        I_ss=I_ss,
+        I_na=I_na,
+        I_k=I_k,
+        I_l=I_l,
+        m_inf=m_inf,
+        h_inf=h_inf,
+        n_inf=n_inf,
+        tau_m=gating_time_constant(v, "m"),
+        tau_h=gating_time_constant(v, "h"),
+        tau_n=gating_time_constant(v, "n"),
+        v_nullcline_v=v_nullcline_v[order],
+        v_nullcline_n=v_nullcline_n[order],
+        n_nullcline_n=n_inf.copy())
+
+
+def analysis_HH_neuron(par, v_min=-100.0, v_max=50.0, num_v=1501,
+                       num_n=401, I_ext=0.0):
+    """
+    Steady state analysis of the Hodgkin-Huxley neuron, without running a
+    time-domain simulation. Results are cached by the hash of the model
+    parameters, the returned arrays are read-only.
+
+    Args:
+        par (DataFrame): parameter table, as used by simulate_HH_neuron
+        v_min, v_max (float): range of the membrane potential grid [mV]
+        num_v (int): number of points of the membrane potential grid
+        num_n (int): number of points of the n grid of the phase plane
+        I_ext (float): constant injected current for the nullclines [uA]
+
+    Returns:
+        dict: with keys
+        "v": membrane potential grid [mV],
+        "I_ss", "I_na", "I_k", "I_l": steady state I-V curves [uA],
+        "m_inf", "h_inf", "n_inf": gating steady states,
+        "tau_m", "tau_h", "tau_n": gating time constants [ms],
+        "v_nullcline_v", "v_nullcline_n": points of the V-nullcline of the
+        reduced (V, n) system,
+        "n_nullcline_n": n-nullcline of the reduced system on the v grid
+    """
+
+    return _analysis_HH_neuron(parameter_key(par), float(v_min),
+                               float(v_max), int(num_v), int(num_n),
+                               float(I_ext))
+
+
 def simulate_HH_neuron(par, input_current, simulation_time):
     """
     A Hodgkin-Huxley neuron implemented in Brian2.
@@ -108,9 +304,9 @@ def simulate_HH_neuron(par, input_current, simulation_time):
 
     # parameter initialization [come from x_inf(v) {x:m,n,h}]
     neuron.vm = v0
-    neuron.m = "alpham/(alpham+betam)"  # 0.05
-    neuron.h = "alphah/(alphah+betah)"  # 0.60
-    neuron.n = "alphan/(alphan+betan)"  # 0.32
+    neuron.m = gating_steady_state(v0 / b2.mV, "m")  # 0.05
+    neuron.h = gating_steady_state(v0 / b2.mV, "h")  # 0.60
+    neuron.n = gating_steady_state(v0 / b2.mV, "n")  # 0.32
 
     # tracking parameters
     state_monitor = b2.StateMonitor(